@@ -0,0 +1,1032 @@
+"""
+P4 Context Menu Setup Tool - window and P4 helpers
+Imported by P4MenuSetup.py once the Qt dependency is available
+"""
+
+import os
+import io
+import locale
+import stat
+import re
+import json
+import time
+import hashlib
+import marshal
+import subprocess
+import shutil
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+# Resolved once, the script location does not change while running
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_SCRIPT_PARENTS = [_SCRIPT_DIR] + list(_SCRIPT_DIR.parents)
+
+# p4 either answers quickly or not at all, fail fast instead of stalling
+_P4_TIMEOUT = 2  # seconds
+
+# Per-user cache for results that are slow to query but rarely change
+_CACHE_DIR = Path.home() / '.cache' / 'p4menu_setup'
+_WORKSPACE_CACHE_TTL = 300  # seconds
+_PROJECT_ROOT_CACHE = _CACHE_DIR / 'project_root.json'
+
+# "[Python]" section header of an ini file, matched only on a line of its own
+_PYTHON_SECTION_RE = re.compile(r'^\[Python\][ \t]*(?=\r?$)', re.MULTILINE)
+
+# Build artifacts never contain a project, skip them when searching. Names
+# are lower case since Windows matches them case-insensitively; hidden
+# directories (.git, .svn, .p4root, .vs, .idea, ...) are skipped as well
+_SKIP_DIRS = frozenset({
+    'intermediate', 'binaries', 'deriveddatacache', 'saved', 'node_modules',
+})
+
+
+def _p4_spawn_options():
+    """Extra Popen arguments that keep p4 from opening a console on Windows"""
+    if os.name != 'nt':
+        return {}
+    # close_fds stays at its default: p4 info and p4 clients are spawned from
+    # two threads at once, and inheriting all handles would let each child
+    # hold the other's pipes open
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    startupinfo.wShowWindow = subprocess.SW_HIDE
+    return {
+        'startupinfo': startupinfo,
+        'creationflags': subprocess.CREATE_NO_WINDOW,
+    }
+
+
+_P4_SPAWN_OPTIONS = _p4_spawn_options()
+
+
+def _p4_run(args, cwd=None):
+    """Run a p4 command in -G mode and return its output records as dicts"""
+    process = subprocess.Popen(
+        ['p4', '-G'] + args,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **_P4_SPAWN_OPTIONS
+    )
+    try:
+        stdout, stderr = process.communicate(timeout=_P4_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise
+    
+    # -G writes one marshalled dict per record, with bytes keys and values
+    records = []
+    stream = io.BytesIO(stdout)
+    while True:
+        try:
+            record = marshal.load(stream)
+        except EOFError:
+            break
+        records.append({
+            _p4_decode(key) if isinstance(key, bytes) else key:
+            _p4_decode(value) if isinstance(value, bytes) else value
+            for key, value in record.items()
+        })
+    
+    if not records and process.returncode != 0:
+        records.append({'code': 'error', 'data': _p4_decode(stderr)})
+    return records
+
+
+def _p4_decode(value):
+    """Decode p4 -G bytes the way text mode would have, never failing"""
+    # Unicode servers send UTF-8, others pass paths through in the client's
+    # code page (e.g. cp1252 on Windows), which the locale encoding matches
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        pass
+    try:
+        return value.decode(locale.getpreferredencoding(False))
+    except (UnicodeDecodeError, LookupError):
+        return value.decode('utf-8', 'replace')
+
+
+def _p4_error(records):
+    """Return the first error message in p4 -G output, or None"""
+    for record in records:
+        if record.get('code') == 'error':
+            return record.get('data', '').strip()
+    return None
+
+
+def _workspace_cache_path(project_root):
+    """Cache file for the workspace list seen from a project"""
+    # The server and user usually come from p4 set or a P4CONFIG file found
+    # relative to the project, so the project root is part of the key
+    project_key = os.path.normcase(os.path.abspath(project_root)) if project_root else ''
+    key = f"{os.environ.get('P4PORT', '')}|{os.environ.get('P4USER', '')}|{project_key}"
+    return _CACHE_DIR / f"workspaces_{hashlib.sha1(key.encode()).hexdigest()[:16]}.json"
+
+
+def _load_workspace_cache(project_root):
+    """Return the cached workspace list, or None if missing or stale"""
+    cache_path = _workspace_cache_path(project_root)
+    try:
+        if time.time() - cache_path.stat().st_mtime >= _WORKSPACE_CACHE_TTL:
+            return None
+        workspaces = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+    return workspaces if isinstance(workspaces, list) else None
+
+
+def _save_cache(cache_path, data):
+    """Write a JSON cache file, ignoring failures since it is only a cache"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(data), encoding='utf-8')
+    except OSError:
+        pass
+
+
+def _save_workspace_cache(workspaces, project_root):
+    """Persist the workspace list seen from a project"""
+    _save_cache(_workspace_cache_path(project_root), workspaces)
+
+
+def _contains_uproject(directory):
+    """Check whether directory directly contains a .uproject file"""
+    try:
+        with os.scandir(directory) as entries:
+            return any(entry.name.lower().endswith('.uproject') for entry in entries)
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _find_project_root():
+    """Search upward from the script directory for a directory containing a .uproject"""
+    # The answer only changes if the script or project moves, so reuse the
+    # last result while it still points at a project
+    try:
+        cached = json.loads(_PROJECT_ROOT_CACHE.read_text(encoding='utf-8'))
+        if (cached['script_dir'] == str(_SCRIPT_DIR)
+                and _contains_uproject(cached['project_root'])):
+            return cached['project_root']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    
+    for parent in _SCRIPT_PARENTS:
+        if _contains_uproject(parent):
+            _save_cache(_PROJECT_ROOT_CACHE, {'script_dir': str(_SCRIPT_DIR), 'project_root': str(parent)})
+            return str(parent)
+    return None
+
+
+def _write_file_atomic(path, data):
+    """Write bytes to a temp file next to path, then swap it into place"""
+    # Perforce leaves files that are not checked out read-only, fail like an
+    # in-place write would instead of silently replacing them
+    if path.exists() and not path.stat().st_mode & stat.S_IWRITE:
+        raise PermissionError(f"{path} is read-only, check it out in Perforce first")
+    
+    # A crash mid-write leaves the original file intact
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        tmp_path.write_bytes(data)
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except OSError:
+        if tmp_path.exists():
+            tmp_path.unlink()
+        raise
+
+
+def _file_has_content(path, data):
+    """Check whether path already holds exactly data"""
+    try:
+        return path.stat().st_size == len(data) and path.read_bytes() == data
+    except OSError:
+        return False
+
+
+# Line ending for generated files, matching what text-mode writes produced
+_NEWLINE = os.linesep.encode()
+
+# Scripts installed into the project's Content/Python folder, kept as bytes
+# with platform line endings so they are written as-is without re-encoding
+_P4_CONTEXT_MENU_BYTES = b'''import unreal
+import subprocess
+import os
+
+class P4ContextMenu:
+    """
+    Adds a 'Show in P4' context menu option to the Content Browser
+    that opens P4V and selects the file in Perforce.
+    """
+    
+    @staticmethod
+    def show_in_p4(asset_paths):
+        """
+        Opens P4V and navigates to the selected asset(s).
+        
+        Args:
+            asset_paths: List of asset paths in Unreal format (/Game/...)
+        """
+        for asset_path in asset_paths:
+            # Convert Unreal asset path to file system path
+            file_path = P4ContextMenu.get_file_path_from_asset(asset_path)
+            
+            if file_path and os.path.exists(file_path):
+                try:
+                    # Use p4vc with CMD to ensure proper execution
+                    # Set working directory to project root to inherit P4 connection settings
+                    project_dir = unreal.Paths.project_dir()
+                    cmd = f'p4vc workspacewindow -s "{file_path}"'
+                    subprocess.Popen(cmd, shell=True, cwd=project_dir)
+                    unreal.log(f"Opening P4V for: {file_path}")
+                except Exception as e:
+                    unreal.log_error(f"Failed to open P4V: {str(e)}")
+                    unreal.log_error(f"Command was: p4vc workspacewindow -s \\"{file_path}\\"")
+            else:
+                unreal.log_error(f"File not found: {file_path}")
+    
+    @staticmethod
+    def get_file_path_from_asset(asset_path):
+        """
+        Converts an Unreal asset path to a file system path.
+        
+        Args:
+            asset_path: Unreal asset path (e.g., /Game/MyFolder/MyAsset)
+            
+        Returns:
+            Full file system path to the .uasset file
+        """
+        # Remove any sub-object references (e.g., /Game/Asset.Asset:SubObject)
+        package_name = asset_path.split('.')[0]
+        
+        # Convert /Game/ path to Content/ path
+        if package_name.startswith('/Game/'):
+            relative_path = package_name.replace('/Game/', '', 1)
+            
+            # Get the full project content directory and normalize it
+            content_dir = unreal.Paths.project_content_dir()
+            content_dir = os.path.abspath(content_dir)
+            
+            # Build the full file path
+            file_path = os.path.join(content_dir, relative_path + '.uasset')
+            
+            # Normalize the path to resolve any .. or . components
+            file_path = os.path.abspath(file_path)
+            
+            unreal.log(f"Converted {asset_path} to {file_path}")
+            return file_path
+        else:
+            # Handle engine content or plugin content
+            unreal.log_warning(f"Non-game content path: {package_name}")
+            return None
+    
+    @staticmethod
+    def register_menu():
+        """
+        Registers the context menu extension with Unreal's Content Browser.
+        """
+        # Create a new menu entry
+        menus = unreal.ToolMenus.get()
+        
+        # Find the Content Browser asset context menu
+        # The menu name for right-click on assets is "ContentBrowser.AssetContextMenu"
+        menu_name = "ContentBrowser.AssetContextMenu"
+        menu = menus.find_menu(menu_name)
+        
+        if not menu:
+            unreal.log_error(f"Could not find menu: {menu_name}")
+            return
+        
+        # Add a new section for source control operations
+        entry = unreal.ToolMenuEntry(
+            name="ShowInP4",
+            type=unreal.MultiBlockType.MENU_ENTRY,
+        )
+        entry.set_label(unreal.Text("Show in P4"))
+        entry.set_tool_tip(unreal.Text("Open Perforce and select this file"))
+        
+        # Set the menu entry to call our function
+        entry.set_string_command(
+            type=unreal.ToolMenuStringCommandType.PYTHON,
+            custom_type="",
+            string="import p4_context_menu; p4_context_menu.on_show_in_p4_clicked()"
+        )
+        
+        # Add to the source control section (or create new section)
+        menu.add_menu_entry("SourceControl", entry)
+        
+        menus.refresh_all_widgets()
+        unreal.log("P4 Context Menu registered successfully!")
+
+
+def on_show_in_p4_clicked():
+    """
+    Called when the 'Show in P4' menu item is clicked.
+    Gets the selected assets and opens them in P4V.
+    """
+    # Get the currently selected assets in Content Browser
+    utility = unreal.EditorUtilityLibrary()
+    selected_assets = utility.get_selected_assets()
+    
+    if not selected_assets:
+        unreal.log_warning("No assets selected")
+        return
+    
+    # Get asset paths
+    asset_paths = [asset.get_path_name() for asset in selected_assets]
+    
+    # Show in P4
+    P4ContextMenu.show_in_p4(asset_paths)
+
+
+# Register the menu when this script is executed
+if __name__ == '__main__':
+    P4ContextMenu.register_menu()
+'''.replace(b'\n', _NEWLINE)
+
+_INIT_UNREAL_BYTES = b'''"""
+Startup script for Unreal Engine Python
+This file is automatically executed when the editor starts.
+"""
+
+import unreal
+
+# Register the P4 context menu
+try:
+    import p4_context_menu
+    p4_context_menu.P4ContextMenu.register_menu()
+    unreal.log("P4 Context Menu initialized on startup")
+except Exception as e:
+    unreal.log_error(f"Failed to initialize P4 Context Menu: {str(e)}")
+'''.replace(b'\n', _NEWLINE)
+
+
+# Import Qt libraries
+try:
+    from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                                   QHBoxLayout, QLabel, QLineEdit, QPushButton, 
+                                   QTextEdit, QFileDialog, QMessageBox, QComboBox)
+    from PySide6.QtCore import Qt, QObject, QThread, QTimer, Signal, Slot
+    from PySide6.QtGui import QFont
+    QMessageBox_Yes = QMessageBox.StandardButton.Yes
+    QMessageBox_No = QMessageBox.StandardButton.No
+except ImportError:
+    from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                                 QHBoxLayout, QLabel, QLineEdit, QPushButton, 
+                                 QTextEdit, QFileDialog, QMessageBox, QComboBox)
+    from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal as Signal, pyqtSlot as Slot
+    from PyQt5.QtGui import QFont
+    QMessageBox_Yes = QMessageBox.Yes
+    QMessageBox_No = QMessageBox.No
+
+
+class P4Worker(QObject):
+    """Runs the blocking p4 queries on a background thread"""
+    workspacesReady = Signal(list)
+    detectReady = Signal(str)
+    logMessage = Signal(str)
+    
+    def __init__(self):
+        super().__init__()
+        # p4 info reports both the user name and the client root, so one
+        # call serves loading and detection alike
+        self._p4_info_cache = None
+        self._p4_info_cwd = None
+        self._p4_exe = None
+    
+    def _has_p4(self):
+        """Check once whether the p4 command is on PATH"""
+        if self._p4_exe is None:
+            self._p4_exe = shutil.which('p4') or ''
+        return bool(self._p4_exe)
+    
+    def _get_p4_info(self, cwd=None):
+        """Return p4 info records for cwd, running the command only once"""
+        if self._p4_info_cache is None or self._p4_info_cwd != cwd:
+            records = _p4_run(['info'], cwd=cwd)
+            # Errors (server down, not logged in) are retried on the next
+            # call instead of sticking until the project changes
+            if _p4_error(records):
+                return records
+            self._p4_info_cache = records
+            self._p4_info_cwd = cwd
+        return self._p4_info_cache
+    
+    @Slot()
+    def reset_p4_info(self):
+        """Forget the cached p4 info, e.g. after the project changed"""
+        self._p4_info_cache = None
+    
+    @Slot(str)
+    def run_load(self, project_root):
+        """Query P4 for the user's workspaces and emit workspacesReady"""
+        self.logMessage.emit("Loading P4 workspaces...")
+        workspaces = []
+        cwd = project_root or None
+        
+        if not self._has_p4():
+            self.logMessage.emit("⚠ P4 command not found")
+            self.workspacesReady.emit(workspaces)
+            return
+        
+        try:
+            # --me lets p4 resolve the user itself, so listing clients does not
+            # wait on p4 info. Info still runs alongside to warm the shared
+            # cache that workspace detection reads next
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                info_future = executor.submit(self._get_p4_info, cwd)
+                clients_future = executor.submit(_p4_run, ['clients', '--me'], cwd)
+                info_records = info_future.result()
+                clients_records = clients_future.result()
+            
+            # Servers that predate --me reject the option by name, ask for the
+            # user explicitly there. Other errors (login, connection) would
+            # fail the same way again, so they are reported as they are
+            clients_error = _p4_error(clients_records)
+            if (clients_error and '--me' in clients_error
+                    and info_records and not _p4_error(info_records)):
+                current_user = info_records[0].get('userName')
+                if current_user:
+                    clients_records = _p4_run(['clients', '-u', current_user], cwd=cwd)
+            
+            error = _p4_error(clients_records)
+            if not error:
+                for record in clients_records:
+                    client_name = record.get('client')
+                    root_path = record.get('Root')
+                    if client_name and root_path:
+                        workspaces.append({
+                            'name': client_name,
+                            # Normalize path
+                            'root': os.path.normpath(root_path)
+                        })
+                _save_workspace_cache(workspaces, project_root)
+            else:
+                self.logMessage.emit(f"⚠ Could not list workspaces: {error[:200]}")
+                    
+        except FileNotFoundError:
+            self.logMessage.emit("⚠ P4 command not found")
+        except Exception as e:
+            self.logMessage.emit(f"⚠ Error loading workspaces: {str(e)}")
+        
+        self.workspacesReady.emit(workspaces)
+    
+    @Slot(str)
+    def run_detect(self, project_root):
+        """Detect the P4 workspace root of a project and emit detectReady"""
+        if not self._has_p4():
+            self.logMessage.emit("⚠ P4 command not found. Please ensure Perforce is installed and in PATH.")
+            self.detectReady.emit('')
+            return
+        
+        try:
+            # Method 1: Try p4 info command
+            records = self._get_p4_info(project_root)
+            
+            error = _p4_error(records)
+            if records and not error:
+                info = records[0]
+                self.logMessage.emit("P4 info output:\n" + "\n".join(
+                    f"{key}: {value}" for key, value in info.items() if key != 'code'
+                )[:500])
+                
+                workspace_root = info.get('clientRoot')
+                if workspace_root:
+                    # Remove any trailing slashes and convert to proper path
+                    workspace_root = os.path.normpath(workspace_root)
+                    
+                    if workspace_root != '.':
+                        self.logMessage.emit(f"✓ Auto-detected workspace: {workspace_root}")
+                        self.detectReady.emit(workspace_root)
+                        return
+            elif error:
+                self.logMessage.emit("P4 info returned an error")
+                self.logMessage.emit(f"Error: {error[:200]}")
+            
+            # Method 2: Try to find P4CONFIG file
+            self.logMessage.emit("Trying P4CONFIG method...")
+            p4config_name = os.environ.get('P4CONFIG', '.p4config')
+            current = os.path.abspath(project_root)
+            
+            # Walk upward with plain os.path calls, one stat per level,
+            # stopping at the volume boundary
+            while True:
+                if os.path.isfile(os.path.join(current, p4config_name)):
+                    self.logMessage.emit(f"✓ Found P4CONFIG at: {current}")
+                    self.logMessage.emit(f"✓ Using workspace: {current}")
+                    self.detectReady.emit(current)
+                    return
+                parent = os.path.dirname(current)
+                if parent == current or os.path.ismount(current):
+                    break
+                current = parent
+            
+            # Method 3: Use project root as fallback
+            self.logMessage.emit("Using project root as workspace fallback")
+            
+        except FileNotFoundError:
+            self.logMessage.emit("⚠ P4 command not found. Please ensure Perforce is installed and in PATH.")
+        except Exception as e:
+            self.logMessage.emit(f"⚠ P4 detection failed: {str(e)}")
+        
+        self.detectReady.emit('')
+
+
+class P4MenuSetupWindow(QMainWindow):
+    requestLoad = Signal(str)
+    requestDetect = Signal(str)
+    requestResetInfo = Signal()
+    
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("P4 Context Menu Setup")
+        self.setFixedSize(500, 400)
+        
+        # Initialize variables
+        self.project_root = None
+        self.workspace_root = None
+        self.available_workspaces = []
+        self._workspace_index = {}  # normalized root path -> combo index
+        self._log_buffer = []
+        self._log_flush_pending = False
+        
+        # Initialize UI first
+        self.init_ui()
+        
+        # P4 queries can block for seconds, so they run on a worker thread
+        self.p4_thread = QThread(self)
+        self.worker = P4Worker()
+        self.worker.moveToThread(self.p4_thread)
+        self.worker.workspacesReady.connect(self.on_workspaces_loaded)
+        self.worker.detectReady.connect(self.on_workspace_detected)
+        self.worker.logMessage.connect(self.log)
+        self.requestLoad.connect(self.worker.run_load)
+        self.requestDetect.connect(self.worker.run_detect)
+        self.requestResetInfo.connect(self.worker.reset_p4_info)
+        self.p4_thread.start()
+        
+        # Then detect project and workspaces
+        self.project_root = self.detect_project_root()
+        self.project_label.setText(self.project_root or "Not detected")
+        self._detect_after_load = True
+        # Populating the combo selects a workspace, which may move project_root,
+        # so refresh under the root the cache was read with to rewrite that entry
+        cache_root = self.project_root or ''
+        cached_workspaces = _load_workspace_cache(cache_root)
+        if cached_workspaces:
+            # Show cached workspaces right away and refresh them in the background
+            self.log("Using cached P4 workspaces, refreshing...")
+            self.populate_workspaces(cached_workspaces)
+            self._detect_after_load = False
+        self.requestLoad.emit(cache_root)
+        if cached_workspaces:
+            self.detect_workspace()
+    
+    def init_ui(self):
+        """Initialize the user interface"""
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+        layout.setSpacing(10)
+        layout.setContentsMargins(15, 15, 15, 15)
+        
+        # Title
+        title = QLabel("P4 Context Menu Setup")
+        title_font = QFont()
+        title_font.setPointSize(14)
+        title_font.setBold(True)
+        title.setFont(title_font)
+        layout.addWidget(title)
+        
+        # Project root display
+        layout.addWidget(QLabel("Unreal Project:"))
+        project_layout = QHBoxLayout()
+        self.project_label = QLabel("Detecting...")
+        self.project_label.setStyleSheet("background-color: #f0f0f0; padding: 5px; border-radius: 3px;")
+        project_layout.addWidget(self.project_label)
+        
+        browse_project_btn = QPushButton("Browse")
+        browse_project_btn.clicked.connect(self.browse_project)
+        browse_project_btn.setMaximumWidth(80)
+        project_layout.addWidget(browse_project_btn)
+        layout.addLayout(project_layout)
+        
+        # Workspace directory with dropdown
+        layout.addWidget(QLabel("P4 Workspace:"))
+        workspace_layout = QHBoxLayout()
+        
+        self.workspace_combo = QComboBox()
+        self.workspace_combo.setEditable(True)
+        self.workspace_combo.setPlaceholderText("Loading workspaces...")
+        self.workspace_combo.currentTextChanged.connect(self.on_workspace_selected)
+        workspace_layout.addWidget(self.workspace_combo)
+        
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.load_available_workspaces)
+        refresh_btn.setMaximumWidth(80)
+        workspace_layout.addWidget(refresh_btn)
+        
+        browse_btn = QPushButton("Browse")
+        browse_btn.clicked.connect(self.browse_workspace)
+        browse_btn.setMaximumWidth(80)
+        workspace_layout.addWidget(browse_btn)
+        layout.addLayout(workspace_layout)
+        
+        # Status/Log area
+        layout.addWidget(QLabel("Status:"))
+        self.log_area = QTextEdit()
+        self.log_area.setReadOnly(True)
+        self.log_area.setMaximumHeight(150)
+        self.log_area.setStyleSheet("background-color: #2b2b2b; color: #d4d4d4; font-family: Consolas, monospace;")
+        layout.addWidget(self.log_area)
+        
+        # Install button
+        self.install_btn = QPushButton("Install P4 Context Menu")
+        self.install_btn.clicked.connect(self.install)
+        self.install_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #0e639c;
+                color: white;
+                padding: 10px;
+                font-weight: bold;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: #1177bb;
+            }
+            QPushButton:disabled {
+                background-color: #cccccc;
+            }
+        """)
+        layout.addWidget(self.install_btn)
+        
+        self.log("Ready to install...")
+    
+    def detect_project_root(self):
+        """Detect the Unreal project root directory"""
+        # Search upward from the current script location
+        project_root = _find_project_root()
+        if project_root:
+            self.log(f"✓ Found Unreal project: {project_root}")
+            return project_root
+        
+        self.log("⚠ Could not auto-detect project root")
+        return None
+    
+    def load_available_workspaces(self):
+        """Reload all available P4 workspaces in the background"""
+        self.requestLoad.emit(self.project_root or '')
+    
+    @Slot(list)
+    def on_workspaces_loaded(self, workspaces):
+        """Populate dropdown once the worker has listed the workspaces"""
+        if workspaces and workspaces == self.available_workspaces:
+            self.log(f"✓ Workspace list up to date ({len(workspaces)} workspace(s))")
+        else:
+            self.populate_workspaces(workspaces)
+            if self.workspace_root:
+                self.select_workspace_in_combo(self.workspace_root)
+        
+        if self._detect_after_load:
+            self._detect_after_load = False
+            self.detect_workspace()
+    
+    def populate_workspaces(self, workspaces):
+        """Populate dropdown with the given workspaces"""
+        self.workspace_combo.clear()
+        self._workspace_index = {}
+        self.available_workspaces = workspaces
+        
+        for workspace in workspaces:
+            self.add_workspace_item(f"{workspace['name']} ({workspace['root']})", workspace['root'])
+        
+        if workspaces:
+            self.log(f"✓ Found {len(workspaces)} workspace(s)")
+        else:
+            self.log("⚠ No workspaces found")
+            # Add manual entry option
+            if self.project_root:
+                self.add_workspace_item(f"Manual: {self.project_root}", self.project_root)
+    
+    def add_workspace_item(self, label, root_path):
+        """Add a workspace to the dropdown and index it by normalized path"""
+        self.workspace_combo.addItem(label, root_path)
+        self._workspace_index.setdefault(os.path.normpath(root_path), self.workspace_combo.count() - 1)
+    
+    def on_workspace_selected(self, text):
+        """Handle workspace selection from dropdown"""
+        # Get the data (root path) associated with the selected item
+        index = self.workspace_combo.currentIndex()
+        if index >= 0:
+            root_path = self.workspace_combo.itemData(index)
+            if root_path:
+                self.workspace_root = root_path
+                self.log(f"Selected workspace: {root_path}")
+                # Try to find Unreal project in the workspace
+                self.find_project_in_workspace(root_path)
+    
+    def find_project_in_workspace(self, workspace_path):
+        """Search for Unreal project files within the workspace"""
+        self.log(f"Searching for Unreal projects in workspace...")
+        
+        try:
+            workspace_dir = Path(workspace_path)
+            if not workspace_dir.exists():
+                self.log(f"⚠ Workspace path does not exist: {workspace_path}")
+                return
+            
+            # Breadth-first search for .uproject files, up to 3 levels deep,
+            # stopping at the first directory that contains any
+            uproject_files = []
+            pending = deque([(str(workspace_dir), 0)])
+            
+            while pending and not uproject_files:
+                directory, depth = pending.popleft()
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.name.lower().endswith('.uproject'):
+                                uproject_files.append(Path(entry.path))
+                            elif (depth + 1 < 3
+                                  and not entry.name.startswith('.')
+                                  and entry.name.lower() not in _SKIP_DIRS
+                                  and entry.is_dir(follow_symlinks=False)):
+                                pending.append((entry.path, depth + 1))
+                except OSError:
+                    continue  # Unreadable directory, skip it
+            uproject_files.sort()
+            
+            if uproject_files:
+                # Use the first project found
+                project_path = uproject_files[0].parent
+                self.project_root = str(project_path)
+                self.project_label.setText(str(project_path))
+                self.log(f"✓ Found Unreal project: {project_path}")
+                
+                if len(uproject_files) > 1:
+                    self.log(f"ℹ Found {len(uproject_files)} projects, using: {uproject_files[0].name}")
+            else:
+                self.log(f"⚠ No .uproject files found in workspace")
+                self.log(f"Please use the Browse button to select your project folder")
+                
+        except Exception as e:
+            self.log(f"⚠ Error searching workspace: {str(e)}")
+    
+    def detect_workspace(self):
+        """Find the project if needed, then auto-detect its workspace"""
+        # If project wasn't found from script location, try workspace
+        if not self.project_root and self.available_workspaces:
+            # Try first workspace
+            first_workspace = self.available_workspaces[0]['root']
+            self.find_project_in_workspace(first_workspace)
+        
+        self.auto_detect_workspace()
+    
+    def auto_detect_workspace(self):
+        """Auto-detect P4 workspace root in the background"""
+        if not self.project_root:
+            self.log("⚠ No project root set, cannot detect workspace")
+            return
+        
+        self.log("Detecting P4 workspace...")
+        self.requestDetect.emit(self.project_root)
+    
+    @Slot(str)
+    def on_workspace_detected(self, workspace_root):
+        """Select the detected workspace, falling back to the project root"""
+        if workspace_root:
+            self.workspace_root = workspace_root
+            # Try to select it in the combo box
+            self.select_workspace_in_combo(workspace_root)
+            return
+        
+        self.workspace_root = self.project_root
+        self.select_workspace_in_combo(self.project_root)
+        self.log(f"⚠ Using project root as workspace: {self.project_root}")
+        self.log("Please verify this is correct or select from dropdown.")
+    
+    def select_workspace_in_combo(self, workspace_path):
+        """Select a workspace in the combo box by its path"""
+        if not workspace_path:
+            return
+        
+        # Normalize the path for comparison
+        workspace_path = os.path.normpath(workspace_path)
+        
+        # Try to find and select the matching workspace
+        index = self._workspace_index.get(workspace_path)
+        if index is not None:
+            self.workspace_combo.setCurrentIndex(index)
+            return
+        
+        # If not found, set as custom text
+        self.workspace_combo.setEditText(workspace_path)
+    
+    def browse_project(self):
+        """Browse for Unreal project directory"""
+        directory = QFileDialog.getExistingDirectory(
+            self,
+            "Select Unreal Project Root (containing .uproject file)",
+            self.project_root or ""
+        )
+        if directory:
+            # Verify it contains a .uproject file
+            if _contains_uproject(directory):
+                self.project_root = directory
+                self.project_label.setText(directory)
+                self.log(f"✓ Project set to: {directory}")
+                # Reload workspaces and auto-detect, the new location
+                # may resolve to a different client via P4CONFIG
+                self.requestResetInfo.emit()
+                self._detect_after_load = True
+                self.load_available_workspaces()
+            else:
+                QMessageBox.warning(
+                    self,
+                    "Invalid Project",
+                    "Selected directory does not contain a .uproject file!"
+                )
+    
+    def browse_workspace(self):
+        """Browse for workspace directory"""
+        current_text = self.workspace_combo.currentText()
+        directory = QFileDialog.getExistingDirectory(
+            self,
+            "Select P4 Workspace Root",
+            current_text or self.project_root or ""
+        )
+        if directory:
+            self.workspace_combo.setEditText(directory)
+            self.workspace_root = directory
+            self.log(f"✓ Manually selected workspace: {directory}")
+            # Try to find project in the selected workspace
+            self.find_project_in_workspace(directory)
+    
+    @Slot(str)
+    def log(self, message):
+        """Add message to log area"""
+        # Lines often arrive in bursts, so collect them and update the
+        # text layout and scrollbar once per burst
+        self._log_buffer.append(message)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            QTimer.singleShot(50, self._flush_log)
+    
+    def _flush_log(self):
+        """Append all buffered log lines to the log area"""
+        self._log_flush_pending = False
+        if not self._log_buffer:
+            return
+        self.log_area.append("\n".join(self._log_buffer))
+        self._log_buffer = []
+        self.log_area.verticalScrollBar().setValue(
+            self.log_area.verticalScrollBar().maximum()
+        )
+    
+    def closeEvent(self, event):
+        """Stop the P4 worker thread before closing"""
+        self.p4_thread.quit()
+        self.p4_thread.wait()
+        super().closeEvent(event)
+    
+    def install(self):
+        """Perform the installation"""
+        if not self.project_root:
+            reply = QMessageBox.question(
+                self,
+                "Project Not Detected",
+                "Could not auto-detect Unreal project root.\n\nWould you like to browse for the project folder?",
+                QMessageBox_Yes | QMessageBox_No
+            )
+            if reply == QMessageBox_Yes:
+                self.browse_project()
+                if not self.project_root:
+                    return
+            else:
+                return
+        
+        workspace = self.workspace_combo.currentText().strip()
+        if not workspace:
+            QMessageBox.warning(self, "Warning", "Please specify P4 workspace root!")
+            return
+        
+        self.install_btn.setEnabled(False)
+        self.log("\n--- Starting Installation ---")
+        
+        try:
+            # Step 1: Create Python directory
+            self.log("\n[1/3] Creating Python directory...")
+            python_dir = Path(self.project_root) / "Content" / "Python"
+            python_dir.mkdir(parents=True, exist_ok=True)
+            self.log(f"✓ Created: {python_dir}")
+            self._flush_log()
+            
+            # Step 2: Copy/Create Python scripts
+            self.log("\n[2/3] Installing Python scripts...")
+            pending_writes = [
+                self.create_p4_context_menu_script(python_dir),
+                self.create_init_script(python_dir),
+            ]
+            self._flush_log()
+            
+            # Step 3: Update DefaultEngine.ini
+            self.log("\n[3/3] Updating DefaultEngine.ini...")
+            config_path = Path(self.project_root) / "Config" / "DefaultEngine.ini"
+            ini_write = self.update_engine_ini(config_path)
+            if ini_write:
+                pending_writes.append(ini_write)
+            self._flush_log()
+            
+            # Write all files in a single batch
+            self.write_files(pending_writes)
+            self.log("✓ Scripts installed and configuration updated")
+            
+            self.log("\n✓✓✓ Installation Complete! ✓✓✓")
+            self.log("\nRestart Unreal Engine to see the 'Show in P4' context menu.")
+            self._flush_log()
+            
+            QMessageBox.information(
+                self,
+                "Success",
+                "P4 Context Menu installed successfully!\n\nRestart Unreal Engine to activate."
+            )
+            
+        except Exception as e:
+            self.log(f"\n✗ Error: {str(e)}")
+            self._flush_log()
+            QMessageBox.critical(self, "Installation Error", str(e))
+        finally:
+            self.install_btn.setEnabled(True)
+    
+    def write_files(self, pending_writes):
+        """Write a batch of (path, bytes) pairs concurrently"""
+        # Reinstalls leave most files untouched, so skip identical content
+        changed = []
+        for path, data in pending_writes:
+            if _file_has_content(path, data):
+                self.log(f"  ℹ {path.name} already up to date")
+            else:
+                changed.append((path, data))
+        if not changed:
+            return
+        
+        paths, payloads = zip(*changed)
+        with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+            # Consume the results so that any write error is raised here
+            list(executor.map(_write_file_atomic, paths, payloads))
+        for path in paths:
+            self.log(f"  ✓ Wrote {path.name}")
+    
+    def create_p4_context_menu_script(self, python_dir):
+        """Return the (path, bytes) to write for the p4_context_menu.py script"""
+        return python_dir / "p4_context_menu.py", _P4_CONTEXT_MENU_BYTES
+    
+    def create_init_script(self, python_dir):
+        """Return the (path, bytes) to write for the init_unreal.py script"""
+        return python_dir / "init_unreal.py", _INIT_UNREAL_BYTES
+    
+    def update_engine_ini(self, config_path):
+        """Update DefaultEngine.ini with Python startup script
+        
+        Returns the (path, bytes) to write, or None if no change is needed.
+        """
+        if not config_path.exists():
+            self.log(f"  ⚠ {config_path} not found, creating new file...")
+            config_path.parent.mkdir(parents=True, exist_ok=True)
+            return config_path, b"[Python]\n+StartupScripts=init_unreal.py\n".replace(b'\n', _NEWLINE)
+        
+        # Read existing config once, keeping its line endings
+        config_data = config_path.read_bytes()
+        newline = '\r\n' if b'\r\n' in config_data else '\n'
+        config_content = config_data.decode('utf-8')
+        
+        # Check if Python section exists
+        if _PYTHON_SECTION_RE.search(config_content):
+            # Check if startup script is already added
+            if 'init_unreal.py' in config_content:
+                self.log("  ℹ init_unreal.py already configured")
+                return None
+            
+            # Add to existing Python section
+            config_content = _PYTHON_SECTION_RE.sub(
+                lambda match: match.group(0) + newline + '+StartupScripts=init_unreal.py',
+                config_content,
+                count=1
+            )
+        else:
+            # Add new Python section at the end
+            config_content += f'{newline}[Python]{newline}+StartupScripts=init_unreal.py{newline}'
+        
+        # Backup original
+        backup_path = config_path.with_suffix('.ini.backup')
+        shutil.copy2(config_path, backup_path)
+        self.log(f"  ✓ Backup created: {backup_path.name}")
+        
+        return config_path, config_content.encode('utf-8')